@@ -24,10 +24,24 @@ from .middleware import (  # noqa: E402
     HqgAuthMiddleware,
 )
 from ..scheduler.scheduler import scheduler  # noqa: E402
+from ..execution.executor import PooledExecutor  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+
+def _log_warm_failure(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"Executor pool warm-up failed: {task.exception()}", exc_info=task.exception())
 
 # spawn our scheduler in background, run forever
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    warm_task = None
+    if settings.EXECUTOR_POOL_SIZE > 0:
+        # pre-warm sandbox containers without blocking startup; keep a reference so
+        # the task isn't garbage collected and a failed warm-up gets logged
+        warm_task = asyncio.create_task(asyncio.to_thread(PooledExecutor.shared().warm))
+        warm_task.add_done_callback(_log_warm_failure)
     task = asyncio.create_task(scheduler.run())
     yield
     task.cancel()
@@ -35,6 +49,10 @@ async def lifespan(app: FastAPI):
         await task
     except asyncio.CancelledError:
         pass
+    if warm_task is not None:
+        await asyncio.wait([warm_task])  # let an in-flight spawn land before close() reaps the pool
+    if settings.EXECUTOR_POOL_SIZE > 0:
+        PooledExecutor.shared().close()
 
 
 app = FastAPI(title="Backtester API", version="1.0.0", lifespan=lifespan)
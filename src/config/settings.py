@@ -22,6 +22,11 @@ class Settings(BaseSettings):
     MAX_REQUEST_TIME: int = 600  # 10 min
     MAX_MEMORY_KB: int = 100_000
 
+    # Pre-warmed sandbox containers reused across backtests (0 = one `docker run` per backtest)
+    EXECUTOR_POOL_SIZE: int = 0
+    # Recycle a pooled container after this many backtests
+    EXECUTOR_POOL_MAX_RUNS: int = 50
+
     # Optional auth middleware
     HQG_DASH_JWKS_URL: str = ""
     
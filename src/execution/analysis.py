@@ -1,10 +1,35 @@
 import ast
 import builtins
+import functools
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from ..models.request import BacktestRequest
 from . import whitelists
 
 
+# names resolvable as builtins; dir() builds and sorts a fresh list on every call
+_BUILTIN_NAMES: frozenset[str] = frozenset(dir(builtins))
+
+
+# (message, line) pairs, in the order they are added to request.errors
+_Verdict = Tuple[Tuple[str, Optional[int]], ...]
+
+
+@functools.lru_cache(maxsize=32)
+def _analyze_code(code: str) -> _Verdict:
+    """
+    Every analyzer error for a source string, memoized on the source. The
+    verdict depends only on the code, so resubmitted strategies, including
+    reruns that only change config_params, skip both the parse and the walk.
+    """
+    try:
+        tree = ast.parse(code)
+    except SyntaxError as e:
+        return ((f"Syntax error: {e.msg}", e.lineno),)  # can't continue without valid AST
+
+    return _collect(tree)
+
+
 class StaticAnalyzer:
     """
     Static analyzer using Python's AST module to validate user strategy code.
@@ -16,87 +41,106 @@ class StaticAnalyzer:
         Perform static analysis on strategy code.
 
         """
-        code = request.strategy_code
+        for message, line in _analyze_code(request.strategy_code):
+            request.errors.add(message, line=line)
+        return request
 
-        try:
-            tree = ast.parse(code)
-        except SyntaxError as e:
-            request.errors.add(f"Syntax error: {e.msg}", line=e.lineno)
-            return request  # can't continue without valid AST
+    @classmethod
+    def analyze_tree(cls, tree: ast.AST, request: BacktestRequest) -> BacktestRequest:
+        """
+        Run every validation check on an already-parsed tree (uncached).
+        """
+        for message, line in _collect(tree):
+            request.errors.add(message, line=line)
+        return request
 
-        cls._validate_nodes(tree, request)
-        cls._validate_imports(tree, request)
-        cls._validate_builtins(tree, request)
-        cls._validate_attributes(tree, request)
-        cls._validate_strategy_class(tree, request)
 
-        return request
+def _collect(tree: ast.AST) -> _Verdict:
+    """
+    Single ast.walk with a per-node-type dispatch table (_CHECKS). Errors are
+    collected per check and reported in check order: nodes, imports,
+    builtins, attributes, strategy class.
+    """
+    findings = _Findings()
+    allowed_nodes = whitelists.ALLOWED_NODES
+    checks = _CHECKS
 
-    @classmethod
-    def _validate_nodes(cls, tree: ast.AST, request: BacktestRequest) -> None:
-        """Ensure all AST nodes are in our whitelist."""
-        for node in ast.walk(tree):
-            if type(node) not in whitelists.ALLOWED_NODES:
-                request.errors.add(
-                    f"Disallowed syntax: {type(node).__name__}",
-                    line=getattr(node, "lineno", None)
-                )
+    for node in ast.walk(tree):
+        node_type = type(node)
+        # Ensure all AST nodes are in our whitelist
+        if node_type not in allowed_nodes:
+            findings.nodes.append((f"Disallowed syntax: {node_type.__name__}", getattr(node, "lineno", None)))
+        check = checks.get(node_type)
+        if check is not None:
+            check(node, findings)
 
-    @classmethod
-    def _validate_imports(cls, tree: ast.AST, request: BacktestRequest) -> None:
-        """Validate all imports are from allowed modules."""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    module_root = alias.name.split(".")[0]
-                    if module_root not in whitelists.ALLOWED_MODULES:
-                        request.errors.add(
-                            f"Import of '{alias.name}' is not allowed",
-                            line=node.lineno
-                        )
-
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    module_root = node.module.split(".")[0]
-                    if module_root not in whitelists.ALLOWED_MODULES:
-                        request.errors.add(
-                            f"Import from '{node.module}' is not allowed",
-                            line=node.lineno
-                        )
+    verdict = (*findings.nodes, *findings.imports, *findings.builtins, *findings.attributes)
+    if not findings.has_strategy:
+        verdict += (("Code must define a class that inherits from Strategy", None),)
+    return verdict
 
-    @classmethod
-    def _validate_builtins(cls, tree: ast.AST, request: BacktestRequest) -> None:
-        """Validate builtin function calls."""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
-                name = node.func.id
-                if name in whitelists.FORBIDDEN_BUILTINS:
-                    request.errors.add(f"Use of '{name}()' is forbidden", line=node.lineno)
-                elif name in dir(builtins):
-                    if name not in whitelists.ALLOWED_BUILTINS:
-                        request.errors.add(f"Builtin '{name}()' is not allowed", line=node.lineno)
 
-    @classmethod
-    def _validate_attributes(cls, tree: ast.AST, request: BacktestRequest) -> None:
-        """Check for forbidden attribute access."""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Attribute):
-                if node.attr in whitelists.FORBIDDEN_ATTRIBUTES:
-                    request.errors.add(
-                        f"Access to '{node.attr}' is forbidden",
-                        line=node.lineno
-                    )
+class _Findings:
+    """Errors gathered during one _collect walk, grouped by check."""
+    __slots__ = ("nodes", "imports", "builtins", "attributes", "has_strategy")
 
-    @classmethod
-    def _validate_strategy_class(cls, tree: ast.AST, request: BacktestRequest) -> None:
-        """Verify that the code defines a class inheriting from Strategy."""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                for base in node.bases:
-                    # class MyStrategy(Strategy)
-                    if isinstance(base, ast.Name) and base.id == "Strategy":
-                        return
-                    # class MyStrategy(hqg_algorithms.Strategy)
-                    if isinstance(base, ast.Attribute) and base.attr == "Strategy":
-                        return
-        request.errors.add("Code must define a class that inherits from Strategy")
+    def __init__(self):
+        self.nodes: List[Tuple[str, Optional[int]]] = []
+        self.imports: List[Tuple[str, Optional[int]]] = []
+        self.builtins: List[Tuple[str, Optional[int]]] = []
+        self.attributes: List[Tuple[str, Optional[int]]] = []
+        self.has_strategy = False
+
+
+def _check_import(node: ast.Import, findings: _Findings) -> None:
+    """Validate all imports are from allowed modules."""
+    for alias in node.names:
+        module_root = alias.name.split(".")[0]
+        if module_root not in whitelists.ALLOWED_MODULES:
+            findings.imports.append((f"Import of '{alias.name}' is not allowed", node.lineno))
+
+
+def _check_import_from(node: ast.ImportFrom, findings: _Findings) -> None:
+    """Validate from-imports are from allowed modules."""
+    if node.module:
+        module_root = node.module.split(".")[0]
+        if module_root not in whitelists.ALLOWED_MODULES:
+            findings.imports.append((f"Import from '{node.module}' is not allowed", node.lineno))
+
+
+def _check_call(node: ast.Call, findings: _Findings) -> None:
+    """Validate builtin function calls."""
+    if isinstance(node.func, ast.Name):
+        name = node.func.id
+        if name in whitelists.FORBIDDEN_BUILTINS:
+            findings.builtins.append((f"Use of '{name}()' is forbidden", node.lineno))
+        elif name in _BUILTIN_NAMES:
+            if name not in whitelists.ALLOWED_BUILTINS:
+                findings.builtins.append((f"Builtin '{name}()' is not allowed", node.lineno))
+
+
+def _check_attribute(node: ast.Attribute, findings: _Findings) -> None:
+    """Check for forbidden attribute access."""
+    if node.attr in whitelists.FORBIDDEN_ATTRIBUTES:
+        findings.attributes.append((f"Access to '{node.attr}' is forbidden", node.lineno))
+
+
+def _check_class(node: ast.ClassDef, findings: _Findings) -> None:
+    """Record whether the code defines a class inheriting from Strategy."""
+    for base in node.bases:
+        # class MyStrategy(Strategy)
+        if isinstance(base, ast.Name) and base.id == "Strategy":
+            findings.has_strategy = True
+        # class MyStrategy(hqg_algorithms.Strategy)
+        elif isinstance(base, ast.Attribute) and base.attr == "Strategy":
+            findings.has_strategy = True
+
+
+# node type -> check; type(node) lookup replaces an isinstance chain per pass
+_CHECKS: Dict[type, Callable[[Any, _Findings], None]] = {
+    ast.Import: _check_import,
+    ast.ImportFrom: _check_import_from,
+    ast.Call: _check_call,
+    ast.Attribute: _check_attribute,
+    ast.ClassDef: _check_class,
+}
@@ -4,21 +4,42 @@ import cProfile
 import pstats
 import io
 import os
+import types
+import functools
+import base64
+import orjson
 import pandas as pd
+import pyarrow as pa
 from hqg_algorithms import Strategy, BarSize, Slice, Bar
 from typing import Dict, Any
 from src.models.execution import ExecutionPayload, RawExecutionResult
-from src.models.portfolio import Portfolio
+from src.models.portfolio import Portfolio, Fill
 from src.models.recorder import PortfolioRecorder
 from src.models.request import BacktestRequestError
 from src.services.backtester import Backtester
 
 PROFILE = os.environ.get("HQG_PROFILE", "0") == "1"
 
+# compiled strategy code keyed by source, so a process running the same source more
+# than once compiles it once (pooled workers fork per run, so it doesn't span runs there).
+@functools.lru_cache(maxsize=64)
+def _compile_strategy(strategy_code: str) -> types.CodeType:
+    """Return the compiled code object for strategy_code, compiling at most once per source."""
+    return compile(strategy_code, "<strategy>", "exec")
+
+
+def _write_result(result: RawExecutionResult) -> None:
+    """Serialize the result with orjson straight to the stdout byte stream."""
+    sys.stdout.buffer.write(orjson.dumps(result.model_dump()))
+    sys.stdout.buffer.flush()
+
+
 def main():
+    bar_size = BarSize.DAILY
     try:
-        json_payload = sys.stdin.read()
-        payload = ExecutionPayload.model_validate_json(json_payload)
+        # orjson parse + dict validation beats pydantic's JSON path on a multi-MB payload
+        payload = ExecutionPayload.model_validate(orjson.loads(sys.stdin.buffer.read()))
+        bar_size = payload.bar_size
 
         if PROFILE:
             profiler = cProfile.Profile()
@@ -40,25 +61,13 @@ def main():
             sys.stderr.write(stream.getvalue())
 
         result = RawExecutionResult(**result_dict)
-        sys.stdout.write(result.model_dump_json())
+        _write_result(result)
         sys.exit(0)
 
     except Exception as e:
         errors = BacktestRequestError()
         errors.add(str(e))
-        error_result = RawExecutionResult(
-            trades=[],
-            equity_curve={},
-            ohlc={},
-            holding_weights={},
-            final_value=0.0,
-            final_cash=0.0,
-            final_positions={},
-            execution_time=0.0,
-            errors=errors,
-            bar_size=payload.bar_size
-        )
-        sys.stdout.write(error_result.model_dump_json())
+        _write_result(RawExecutionResult.failed(errors, bar_size))
         sys.exit(1)
 
 
@@ -66,28 +75,16 @@ def execute_backtest(payload: ExecutionPayload) -> Dict[str, Any]:
     """
     Execute the backtest by running the strategy code with market data.
 
-    Market data format (JSON):
-    {
-      "AAPL": {
-        "date": ["2023-01-01", "2023-01-02"],
-        "open": [149, 151],
-        "high": [151, 153],
-        "low": [148, 150],
-        "close": [150, 152],
-        "volume": [1000, 1100]
-      },
-      "TSLA": { ... }
-    }
+    Market data arrives as a base64 Arrow IPC stream (see arrow_to_slices):
+    a "date" column plus one float64 column per "{symbol}.{field}", e.g.
+    "AAPL.open", "AAPL.close", "TSLA.volume".
     """
     errors = BacktestRequestError()
     backtester = Backtester()
 
     try:
-        # Convert market_data JSON to pandas DataFrame (MultiIndex format)
-        data = json_to_dataframe(payload.market_data)
-
         # Pre-build timestamp:Slice dict (avoid per-step MultiIndex slicing in loop)
-        slices, timestamps = precompute_slices(data)
+        slices, timestamps = arrow_to_slices(payload.market_data_arrow)
 
         # TODO: refactor w/ StrategyLoader (no write)
         # Load strategy class
@@ -95,13 +92,12 @@ def execute_backtest(payload: ExecutionPayload) -> Dict[str, Any]:
 
         # Inject config module if config_params provided
         if payload.config_params:
-            import types
             config_module = types.ModuleType('config')
             for key, value in payload.config_params.items():
                 setattr(config_module, key, value)
             sys.modules['config'] = config_module
 
-        exec(payload.strategy_code, strategy_namespace)
+        exec(_compile_strategy(payload.strategy_code), strategy_namespace)
 
         # Find Strategy subclass
         strategy_class = None
@@ -123,7 +119,7 @@ def execute_backtest(payload: ExecutionPayload) -> Dict[str, Any]:
         # run backtest loop; recorder accumulates ohlc, equity, weights
         trades = backtester._run_loop(strategy, slices, timestamps, portfolio, recorder)
 
-        # extract all time-series from recorder
+        # extract all time-series from recorder (equity/ohlc as columns aligned with timestamps)
         equity_curve = recorder.to_equity_curve()
         ohlc = recorder.to_ohlc()
         holding_weights = recorder.to_holding_weights()
@@ -133,10 +129,11 @@ def execute_backtest(payload: ExecutionPayload) -> Dict[str, Any]:
         final_prices = backtester._get_close(final_slice, symbols)
 
         return {
-            "orders": [t.model_dump() for t in trades],
-            "equity_curve": {ts.isoformat(): v for ts, v in equity_curve.items()},
-            "ohlc": {ts.isoformat(): v for ts, v in ohlc.items()},
-            "holding_weights": {ts.isoformat(): v for ts, v in holding_weights.items()},
+            "orders": Fill.to_columns(trades),
+            "timestamps": recorder.to_timestamps(),
+            "equity_curve": equity_curve,
+            "ohlc": ohlc,
+            "holding_weights": holding_weights,
             "final_value": portfolio.get_total_value(final_prices),
             "final_cash": portfolio.cash,
             "final_positions": portfolio.positions.copy(),
@@ -147,79 +144,47 @@ def execute_backtest(payload: ExecutionPayload) -> Dict[str, Any]:
 
     except Exception as e:
         errors.add(f"Strategy execution error: {str(e)}")
-        return {
-            "orders": [],
-            "equity_curve": {},
-            "ohlc": {},
-            "holding_weights": {},
-            "final_value": 0.0,
-            "final_cash": 0.0,
-            "final_positions": {},
-            "errors": errors,
-            "bar_size": BarSize.DAILY   # in case of failure before cadence defined
-        }
-
+        # DAILY in case of failure before cadence defined
+        return dict(RawExecutionResult.failed(errors, BarSize.DAILY))
 
-def json_to_dataframe(market_data: Dict[str, Any]) -> pd.DataFrame:
-    """
-    Convert JSON market data to pandas DataFrame with MultiIndex columns.
 
-    Input: {"AAPL": {"date": [...], "open": [...], ...}}
-    Output: DataFrame with DatetimeIndex and MultiIndex columns (symbol, field)
-    """
-    frames = {}
-    for symbol, data_dict in market_data.items():
-        df = pd.DataFrame(data_dict)
-        df['date'] = pd.to_datetime(df['date'])
-        df = df.set_index('date')
-        frames[symbol] = df
-
-    # Build MultiIndex DataFrame
-    all_data = []
-    for symbol, df in frames.items():
-        for field in ["open", "high", "low", "close", "volume"]:
-            if field in df.columns:
-                all_data.append((symbol, field, df[field]))
-
-    if not all_data:
-        return pd.DataFrame()
-
-    # Create MultiIndex columns
-    tuples = [(symbol, field) for symbol, field, _ in all_data]
-    columns = pd.MultiIndex.from_tuples(tuples)
-
-    # Create DataFrame with MultiIndex columns
-    formatted = pd.DataFrame({i: data for i, (_, _, data) in enumerate(all_data)})
-    formatted.columns = columns
-
-    return formatted
-
-def precompute_slices(data: pd.DataFrame) -> tuple[Dict, list]:
+def arrow_to_slices(encoded: str) -> tuple[Dict, list]:
     """
-    Build a dictionary of timestamps: slices for backtest loop
+    Build timestamp:Slice dict from a base64 Arrow IPC stream
+    (see orchestrator.dataframe_to_arrow): a "date" column plus one
+    float64 column per "{symbol}.{field}".
     """
-    timestamps = data.index.tolist()
-    columns = data.columns.tolist()  # [(symbol, field), ...]; e.g. [('AAPL', 'close'), ...]
-    values = data.values  # shape: (n_timestamps, n_columns)
-
-    symbols = list(dict.fromkeys(s for s, _ in columns))
-
-    # Build column index lookup: {(symbol, field): col_index}
-    col_index = {(s, f): j for j, (s, f) in enumerate(columns)}
-
-    slices = {}
-    for i, ts in enumerate(timestamps):
-        bars = {}
-        for s in symbols:
-            bars[s] = Bar(
-                open=float(values[i, col_index[(s, "open")]]),
-                high=float(values[i, col_index[(s, "high")]]),
-                low=float(values[i, col_index[(s, "low")]]),
-                close=float(values[i, col_index[(s, "close")]]),
-                volume=float(values[i, col_index[(s, "volume")]]) if (s, "volume") in col_index else None,
+    table = pa.ipc.open_stream(base64.b64decode(encoded)).read_all()
+    timestamps = pd.DatetimeIndex(table.column("date").to_pandas()).tolist()
+
+    columns: Dict[str, Dict[str, list]] = {}
+    for name in table.column_names:
+        if name == "date":
+            continue
+        symbol, field = name.rsplit(".", 1)  # tickers may contain dots (BRK.B)
+        columns.setdefault(symbol, {})[field] = table.column(name).to_numpy().tolist()
+    return _columns_to_slices(columns, timestamps)
+
+
+def _columns_to_slices(columns: Dict[str, Dict[str, list]], timestamps: list) -> tuple[Dict, list]:
+    """Zip per-symbol field columns (SoA) into a Slice of bars per timestamp."""
+    symbols = list(columns)
+    n = len(timestamps)
+    bars_by_symbol = []
+    for symbol in symbols:
+        fields = columns[symbol]
+        bars_by_symbol.append([
+            Bar(open=o, high=h, low=l, close=c, volume=v)
+            for o, h, l, c, v in zip(
+                fields["open"], fields["high"], fields["low"], fields["close"],
+                fields.get("volume", [None] * n),
             )
-        slices[ts] = Slice(bars)
+        ])
 
+    slices = {
+        ts: Slice(dict(zip(symbols, bars)))
+        for ts, bars in zip(timestamps, zip(*bars_by_symbol))
+    }
     return slices, timestamps
 
 
@@ -0,0 +1,97 @@
+import os
+import signal
+import sys
+import time
+import contextlib
+import orjson
+from hqg_algorithms import BarSize
+from src.models.execution import ExecutionPayload, RawExecutionResult
+from src.models.request import BacktestRequestError
+from src.execution.container.entrypoint import execute_backtest
+
+# Long-lived sandbox worker used by PooledExecutor.
+#
+# Protocol: one orjson-encoded ExecutionPayload per line on stdin, one
+# RawExecutionResult per line on stdout. orjson never emits raw newlines
+# (they are escaped inside strings), so a line is always a whole message.
+# The loop exits when stdin is closed.
+#
+# Each payload runs in a forked child that exits afterwards, so nothing a
+# strategy does to the interpreter (monkeypatching numpy or hqg_algorithms,
+# injected config, module globals) survives into the next run. The parent
+# only imports the backtest stack once; children share it copy-on-write.
+
+
+def _run_line(line: bytes) -> RawExecutionResult:
+    """Run one payload line, mirroring entrypoint.main() without exiting."""
+    bar_size = BarSize.DAILY
+    try:
+        payload = ExecutionPayload.model_validate(orjson.loads(line))
+        bar_size = payload.bar_size
+
+        start = time.time()
+        result_dict = execute_backtest(payload)
+        result_dict["execution_time"] = time.time() - start
+        return RawExecutionResult(**result_dict)
+
+    except Exception as e:
+        errors = BacktestRequestError()
+        errors.add(str(e))
+        return RawExecutionResult.failed(errors, bar_size)
+
+
+def _run_isolated(line: bytes) -> bytes:
+    """Run one payload line in a forked child; returns the encoded result."""
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        status = 1
+        try:
+            os.close(read_fd)
+            # own process group, so anything the strategy starts is killed with it
+            os.setsid()
+            # fd 1 is the result stream: point it at stderr so nothing the strategy
+            # writes (print, native solver output, os.write(1, ...)) can land there
+            os.dup2(2, 1)
+            data = orjson.dumps(_run_line(line).model_dump())
+            # length-prefixed, so the parent never waits on EOF: processes the
+            # strategy started may still hold the pipe open
+            with open(write_fd, "wb") as out:
+                out.write(len(data).to_bytes(8, "little") + data)
+            status = 0
+        finally:
+            # skip atexit handlers and buffers inherited from the parent
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(status)
+
+    os.close(write_fd)
+    with open(read_fd, "rb") as f:
+        size = int.from_bytes(f.read(8), "little")
+        data = f.read(size) if size else b""
+    _, status = os.waitpid(pid, 0)
+    with contextlib.suppress(ProcessLookupError, PermissionError):
+        os.killpg(pid, signal.SIGKILL)
+    if not data or len(data) != size:
+        # the child died before writing a result (sys.exit, a signal, a crash in C code)
+        errors = BacktestRequestError()
+        errors.add(f"Worker process exited with status {os.waitstatus_to_exitcode(status)} before returning a result")
+        return orjson.dumps(RawExecutionResult.failed(errors, BarSize.DAILY).model_dump())
+    return data
+
+
+def main():
+    stdin = sys.stdin.buffer
+    stdout = sys.stdout.buffer
+    while True:
+        line = stdin.readline()
+        if not line:
+            break
+        if not line.strip():
+            continue
+        stdout.write(_run_isolated(line) + b"\n")
+        stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
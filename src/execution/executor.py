@@ -1,7 +1,14 @@
 # executor.py
+import asyncio
 import os
+import select
 import subprocess
+import threading
+import time
 import logging
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+import orjson
 
 from ..models.request import BacktestRequestError
 from ..models.execution import ExecutionPayload, RawExecutionResult
@@ -11,30 +18,69 @@ logger = logging.getLogger(__name__)
 
 DOCKER_IMAGE = "hqg-backtester-sandbox"
 
+
+def _read_line(proc: subprocess.Popen, timeout: float) -> bytearray:
+    """
+    Read proc's stdout into one growing buffer until the first complete line.
+    Raises TimeoutExpired past `timeout` seconds, EOFError if stdout closes first.
+    """
+    deadline = time.monotonic() + timeout
+    fd = proc.stdout.fileno()
+    buf = bytearray()
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise subprocess.TimeoutExpired(proc.args, timeout)
+        ready, _, _ = select.select([fd], [], [], remaining)
+        if not ready:
+            continue
+        chunk = os.read(fd, 1 << 20)
+        if not chunk:
+            raise EOFError("Worker container exited before returning a result")
+        buf += chunk
+        if buf.endswith(b"\n"):
+            return buf
+
+
+def _parse_result(raw: bytes) -> RawExecutionResult:
+    """
+    Parse container output into a RawExecutionResult.
+
+    Everything except holding_weights is validated, since the output crosses the
+    sandbox boundary (the flat timestamp/equity/ohlc/order columns are cheap).
+    holding_weights is validated again entry-by-entry when build_backtest_response
+    turns it into WeightSnapshots, so it only gets a shape check here, which
+    avoids validating the same per-bar data twice.
+    """
+    data = orjson.loads(raw)
+    holding_weights = data.pop("holding_weights", {})
+
+    if not isinstance(holding_weights, dict) or not all(isinstance(v, dict) for v in holding_weights.values()):
+        raise ValueError("Malformed holding_weights in container output")
+
+    result = RawExecutionResult.model_validate(data)
+    result.holding_weights = holding_weights
+    return result
+
+
 class Executor:
     """
     Runs validated user strategies inside a hardened Docker container.
-    Communicates via stdin/stdout JSON.
+    Communicates via stdin/stdout JSON (orjson-encoded bytes).
     """
 
     def __init__(self, image: str = DOCKER_IMAGE, timeout: int = settings.MAX_EXECUTION_TIME):
         self.image = image
         self.timeout = timeout
 
-    def execute(self, payload: ExecutionPayload) -> RawExecutionResult:
-        """
-        Spawn a Docker container, send ExecutionPayload via stdin,
-        read RawExecutionResult from stdout.
-        """
-        errors = BacktestRequestError()
-        payload_json = payload.model_dump_json()
-
+    def _docker_cmd(self, module: str) -> List[str]:
+        """`docker run` command for the hardened sandbox, running `python -m module`."""
         profile = os.environ.get("HQG_PROFILE", "0")
-
-        cmd = [
+        return [
             "docker", "run",
             "--rm",                         # remove container after exit
             "--interactive",                # keep stdin open
+            "--log-driver=none",            # results stream over the attached pipe; don't also journal them to disk
             "--network=none",               # no network access
             "--read-only",                  # read-only filesystem
             "--tmpfs", "/tmp:size=64m",     # small writable /tmp
@@ -45,68 +91,274 @@ class Executor:
             "--cap-drop=ALL",
             "-e", f"HQG_PROFILE={profile}",
             self.image,
-            "python", "-m", "src.execution.container.entrypoint",  # run our execution container, not the web-app
+            "python", "-m", module,  # run our execution container, not the web-app
         ]
 
+    async def execute_async(self, payload: ExecutionPayload) -> RawExecutionResult:
+        """
+        Spawn a Docker container, send ExecutionPayload via stdin, read
+        RawExecutionResult from stdout. The container is awaited on the event loop
+        instead of parking a thread per backtest; only the result parse runs in a thread.
+        """
+        errors = BacktestRequestError()
+        try:
+            # bytes end-to-end: no str round trip on the multi-MB payload
+            stdout, stderr = await self._communicate_async(orjson.dumps(payload.model_dump()), self.timeout)
+            return await asyncio.to_thread(self._handle_output, stdout, stderr, payload, errors)
+        except asyncio.TimeoutError:
+            errors.add(f"Container timed out after {self.timeout}s")
+            return RawExecutionResult.failed(errors, payload.bar_size)
+        except Exception as e:
+            errors.add(f"Container execution failed: {str(e)}")
+            return RawExecutionResult.failed(errors, payload.bar_size)
+
+    async def _communicate_async(self, payload_json: bytes, timeout: float) -> Tuple[bytearray, bytes]:
+        """
+        Run one entrypoint container on payload_json; returns (stdout, stderr).
+        stdout is read into a single growing bytearray and handed to orjson as-is,
+        rather than communicate()'s list of chunks joined into a second copy.
+        """
+        cmd = self._docker_cmd("src.execution.container.entrypoint")
+
         logger.info(f"Spawning container with image {self.image}")
 
+        proc = None
         try:
-            result = subprocess.run(
-                cmd,
-                input=payload_json,
-                capture_output=True,
-                text=True,
-                timeout=self.timeout,
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            stdout, stderr, _ = await asyncio.wait_for(
+                asyncio.gather(self._read_stream(proc.stdout), proc.stderr.read(), self._feed_stdin(proc, payload_json)),
+                timeout=timeout,
             )
+            await proc.wait()
+            return stdout, stderr
+        finally:
+            if proc is not None and proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+
+    @staticmethod
+    async def _read_stream(stream: asyncio.StreamReader) -> bytearray:
+        buf = bytearray()
+        while chunk := await stream.read(1 << 20):
+            buf += chunk
+        return buf
+
+    @staticmethod
+    async def _feed_stdin(proc: asyncio.subprocess.Process, data: bytes) -> None:
+        try:
+            proc.stdin.write(data)
+            await proc.stdin.drain()
+            proc.stdin.close()
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # container exited early; its stderr/exit explains why
+
+    @staticmethod
+    def _log_stderr(stderr_bytes: bytes) -> str:
+        """Log container stderr; returns its first 500 bytes, decoded, for error messages."""
+        if not stderr_bytes:
+            return ""
+        # decode only what gets logged; a chatty strategy can emit megabytes here
+        head = stderr_bytes[:500].decode("utf-8", errors="replace")
+        if b"CONTAINER PROFILE" in stderr_bytes:
+            logger.info(f"Container stderr:\n{stderr_bytes.decode('utf-8', errors='replace')}")
+        else:
+            logger.warning(f"Container stderr: {head}")
+        return head
+
+    @classmethod
+    def _handle_output(
+        cls, stdout: bytes, stderr_bytes: bytes, payload: ExecutionPayload, errors: BacktestRequestError
+    ) -> RawExecutionResult:
+        """Log container stderr and parse its stdout into a RawExecutionResult."""
+        stderr = cls._log_stderr(stderr_bytes)
+
+        # isspace() instead of strip(): no copy of a multi-MB result just to test emptiness
+        if not stdout or stdout.isspace():
+            errors.add(f"Container returned empty output. stderr: {stderr}")
+            return RawExecutionResult.failed(errors, payload.bar_size)
+
+        return _parse_result(stdout)
 
-            if result.stderr:
-                if "CONTAINER PROFILE" in result.stderr:
-                    logger.info(f"Container stderr:\n{result.stderr}")
-                else:
-                    logger.warning(f"Container stderr: {result.stderr[:500]}")
-
-            if not result.stdout.strip():
-                errors.add(f"Container returned empty output. stderr: {result.stderr[:500]}")
-                return RawExecutionResult(
-                    orders=[],
-                    equity_curve={},
-                    ohlc={},
-                    holding_weights={},
-                    final_value=0.0,
-                    final_cash=0.0,
-                    final_positions={},
-                    execution_time=0.0,
-                    errors=errors,
-                    bar_size=payload.bar_size
-                )
-
-            return RawExecutionResult.model_validate_json(result.stdout)
+
+class _PooledWorker:
+    """One long-lived sandbox container running src.execution.container.worker."""
+
+    def __init__(self, cmd: List[str]):
+        self.proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=0,
+        )
+        self.runs = 0
+        # drain stderr continuously so a chatty strategy can't fill the pipe and stall the worker
+        threading.Thread(target=self._drain_stderr, daemon=True).start()
+
+    def _drain_stderr(self) -> None:
+        # the pipe is unbuffered, so each read returns whatever it holds and a burst
+        # (a profile dump) is logged as one message, at the one-shot path's levels
+        for chunk in iter(lambda: self.proc.stderr.read(65536), b""):
+            Executor._log_stderr(chunk)
+
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def request(self, data: bytes, timeout: float) -> bytearray:
+        """Send one payload line, return one result line. Raises TimeoutExpired / EOFError."""
+        view = memoryview(data + b"\n")
+        while view:
+            written = self.proc.stdin.write(view)
+            view = view[written:]
+
+        return _read_line(self.proc, timeout)
+
+    def kill(self) -> None:
+        try:
+            self.proc.kill()
+            self.proc.wait(timeout=5)
+        except Exception:
+            pass
+
+
+class PooledExecutor(Executor):
+    """
+    Executor backed by a pool of pre-warmed sandbox containers.
+
+    Each container runs the line-oriented worker loop, so a backtest pays for
+    `docker run` only when a worker is first spawned or replaced. Containers keep
+    the same hardening flags as the one-shot Executor. The worker forks a fresh
+    process per backtest, so interpreter state doesn't carry between runs; the
+    container itself is killed and replaced on timeout, on crash, and after
+    `max_runs` backtests, which bounds how long anything else (e.g. /tmp files)
+    can persist.
+    """
+
+    _shared: Optional["PooledExecutor"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        size: int = settings.EXECUTOR_POOL_SIZE,
+        max_runs: int = settings.EXECUTOR_POOL_MAX_RUNS,
+        image: str = DOCKER_IMAGE,
+        timeout: int = settings.MAX_EXECUTION_TIME,
+    ):
+        super().__init__(image=image, timeout=timeout)
+        self.size = size
+        self.max_runs = max_runs
+        self._idle: Deque[_PooledWorker] = deque()
+        self._spawned = 0
+        self._closed = False
+        # guards _idle/_spawned/_closed; notified whenever a worker is returned or a slot frees up
+        self._cond = threading.Condition()
+
+    @classmethod
+    def shared(cls) -> "PooledExecutor":
+        """Process-wide pool, so every Orchestrator draws from the same containers."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def warm(self) -> None:
+        """Spawn workers up to `size` ahead of the first request."""
+        while True:
+            with self._cond:
+                if self._closed or self._spawned >= self.size:
+                    return
+                self._spawned += 1
+            try:
+                worker = self._spawn()
+            except Exception:
+                with self._cond:
+                    self._spawned -= 1
+                    self._cond.notify()
+                raise
+            self._release(worker, healthy=True)
+
+    def close(self) -> None:
+        """Kill idle workers; in-flight workers are killed when released."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, deque()
+            self._cond.notify_all()
+        for worker in idle:
+            self._release(worker, healthy=False)
+
+    def _spawn(self) -> _PooledWorker:
+        logger.info(f"Spawning pooled worker container with image {self.image}")
+        return _PooledWorker(self._docker_cmd("src.execution.container.worker"))
+
+    def _acquire(self) -> _PooledWorker:
+        """
+        Take an idle worker, spawn one if the pool has room, or else wait until a
+        worker is returned or retired (a retired worker's slot is respawned here).
+        """
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Executor pool is closed")
+                if self._idle:
+                    return self._idle.popleft()
+                if self._spawned < self.size:
+                    self._spawned += 1
+                    break
+                self._cond.wait()
+        try:
+            return self._spawn()
+        except Exception:
+            with self._cond:
+                self._spawned -= 1
+                self._cond.notify()
+            raise
+
+    def _release(self, worker: _PooledWorker, healthy: bool) -> None:
+        with self._cond:
+            if healthy and not self._closed and worker.alive() and worker.runs < self.max_runs:
+                self._idle.append(worker)
+                self._cond.notify()
+                return
+        worker.kill()
+        with self._cond:
+            self._spawned -= 1
+            self._cond.notify()
+
+    def execute(self, payload: ExecutionPayload) -> RawExecutionResult:
+        """Run the payload on an idle pooled worker, spawning one if the pool has room."""
+        errors = BacktestRequestError()
+        payload_json = orjson.dumps(payload.model_dump())
+
+        try:
+            worker = self._acquire()
+        except Exception as e:
+            errors.add(f"Container execution failed: {str(e)}")
+            return RawExecutionResult.failed(errors, payload.bar_size)
+
+        healthy = False
+        try:
+            line = worker.request(payload_json, self.timeout)
+            worker.runs += 1
+            result = _parse_result(line)
+            # only a cleanly parsed line proves the stream is in sync; on any protocol
+            # or parse error the worker is retired so a stale line can't reach the next caller
+            healthy = True
+            return result
 
         except subprocess.TimeoutExpired:
             errors.add(f"Container timed out after {self.timeout}s")
-            return RawExecutionResult(
-                orders=[],
-                equity_curve={},
-                ohlc={},
-                holding_weights={},
-                final_value=0.0,
-                final_cash=0.0,
-                final_positions={},
-                execution_time=0.0,
-                errors=errors,
-                bar_size=payload.bar_size
-            )
+            return RawExecutionResult.failed(errors, payload.bar_size)
         except Exception as e:
             errors.add(f"Container execution failed: {str(e)}")
-            return RawExecutionResult(
-                orders=[],
-                equity_curve={},
-                ohlc={},
-                holding_weights={},
-                final_value=0.0,
-                final_cash=0.0,
-                final_positions={},
-                execution_time=0.0,
-                errors=errors,
-                bar_size=payload.bar_size
-            )
+            return RawExecutionResult.failed(errors, payload.bar_size)
+        finally:
+            self._release(worker, healthy)
+
+    async def execute_async(self, payload: ExecutionPayload) -> RawExecutionResult:
+        """Pooled workers are driven synchronously; run execute() in a thread."""
+        return await asyncio.to_thread(self.execute, payload)
@@ -1,19 +1,34 @@
 import asyncio
+import base64
+import functools
 import logging
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 from datetime import datetime
-from typing import Dict, Any
-from hqg_algorithms import extract_metadata
+from hqg_algorithms import extract_metadata, StrategyMetadata
 
+from ..config.settings import settings
 from ..models.request import BacktestRequest, ValidationException, ExecutionException
 from ..services.data_provider.yf_provider import YFDataProvider
-from .executor import Executor, ExecutionPayload, RawExecutionResult
+from .executor import Executor, PooledExecutor, ExecutionPayload, RawExecutionResult
 from .output_validator import OutputValidator
 from .analysis import StaticAnalyzer
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=32)
+def _strategy_metadata(code: str) -> StrategyMetadata:
+    """
+    extract_metadata, memoized on the source string. It parses the source
+    twice (validate, then extract) and the result depends only on the code,
+    so resubmitted strategies reuse it. Invalid sources raise and are not
+    cached.
+    """
+    return extract_metadata(code)
+
+
 class Orchestrator:
     """
     Validation pipeline orchestrator.
@@ -22,9 +37,9 @@ class Orchestrator:
         BacktestRequest
         → parse strategy (extract universe, dates, cadence)
         → fetch market data (YFDataProvider w/ parquet cache)
-        → convert DataFrame → JSON
+        → convert DataFrame → Arrow IPC
         → build ExecutionPayload
-        → Executor (Docker container)
+        → Executor (Docker container; PooledExecutor when EXECUTOR_POOL_SIZE > 0)
         → OutputValidator (sanity checks)
         → RawExecutionResult (ready for metrics)
     """
@@ -33,7 +48,7 @@ class Orchestrator:
 
     def __init__(self):
         self.data_provider = YFDataProvider()
-        self.executor = Executor()
+        self.executor = PooledExecutor.shared() if settings.EXECUTOR_POOL_SIZE > 0 else Executor()
         self.output_validator = OutputValidator()
 
     async def run(self, request: BacktestRequest) -> RawExecutionResult:
@@ -50,7 +65,7 @@ class Orchestrator:
                     raise ValidationException(request.errors)
  
                 # Parse strategy code to extract universe + cadence
-                strategy_metadata = extract_metadata(request.strategy_code)
+                strategy_metadata = _strategy_metadata(request.strategy_code)
                 universe, cadence = strategy_metadata.universe, strategy_metadata.cadence
 
                 logger.info(f"Parsed strategy: universe={universe}, bar_size={cadence.bar_size}")
@@ -71,10 +86,8 @@ class Orchestrator:
                     raise ExecutionException(request.errors)
                 logger.info(f"Fetched {len(data)} bars for {universe}")
 
-                # Convert DataFrame → JSON for container
-                
-                # TODO: Use Arrow IPC instead of JSON for faster serialization?
-                market_data_json = dataframe_to_json(data, universe)
+                # Convert DataFrame → Arrow IPC for container
+                market_data_arrow = dataframe_to_arrow(data, universe)
 
                 # Build execution payload
                 payload = ExecutionPayload(
@@ -83,13 +96,13 @@ class Orchestrator:
                     start_date=request.start_date,
                     end_date=request.end_date,
                     initial_capital=request.initial_capital,
-                    market_data=market_data_json,
+                    market_data_arrow=market_data_arrow,
                     bar_size=cadence.bar_size,
                     config_params=request.config_params,
                 )
                 
                 # Execute our payload
-                raw_result = await asyncio.to_thread(self.executor.execute, payload)
+                raw_result = await self.executor.execute_async(payload)
                 
                 if not raw_result.errors.is_empty():
                     raise ExecutionException(raw_result.errors)
@@ -104,25 +117,21 @@ class Orchestrator:
                 raise ExecutionException(request.errors)
 
 
-def dataframe_to_json(data: pd.DataFrame, symbols: list[str]) -> Dict[str, Any]:
+def dataframe_to_arrow(data: pd.DataFrame, symbols: list[str]) -> str:
     """
-    Convert MultiIndex DataFrame to JSON format expected by container.
+    Convert MultiIndex DataFrame to the base64 Arrow IPC stream expected by container.
 
-    Input:  DataFrame with MultiIndex columns (symbol, field) and DatetimeIndex
-    Output: {"AAPL": {"date": [...], "open": [...], "high": [...], ...}}
+    Columns: "date" (the DatetimeIndex) plus one float64 "{symbol}.{field}" column
+    per OHLCV field. The sandbox decodes it without parsing each value.
     """
-    market_data = {}
-
+    arrays = {"date": pa.array(data.index)}
     for symbol in symbols:
-        symbol_data: Dict[str, list] = {"date": []}
-
         for field in ["open", "high", "low", "close", "volume"]:
             if (symbol, field) in data.columns:
-                symbol_data[field] = data[(symbol, field)].tolist()
-
-        # dates from index
-        symbol_data["date"] = [ts.isoformat() for ts in data.index]
-
-        market_data[symbol] = symbol_data
+                arrays[f"{symbol}.{field}"] = pa.array(data[(symbol, field)].to_numpy(dtype=np.float64))
 
-    return market_data
+    table = pa.table(arrays)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return base64.b64encode(sink.getvalue()).decode("ascii")
@@ -1,5 +1,6 @@
 import math
 import logging
+import numpy as np
 from ..models.execution import RawExecutionResult
 from ..models.request import BacktestRequestError, ExecutionException
 
@@ -29,19 +30,36 @@ class OutputValidator:
         if output.final_value < 0:
             errors.add(f"Negative final portfolio value: {output.final_value}")
 
-        # Equity curve check
-        for ts, val in output.equity_curve.items():
-            if math.isnan(val) or math.isinf(val):
-                errors.add(f"Invalid equity curve value at {ts}: {val}")
-
-        # Order check
-        for order in output.orders:
-            price = order.get("price", 0)
-            shares = order.get("shares", 0)
-            if price <= 0:
-                errors.add(f"Order with non-positive price: {price}")
-            if shares <= 0:
-                errors.add(f"Order with non-positive shares: {shares}")
+        # Equity curve check: one vectorized scan; only walk the values to report bad points
+        equity = np.asarray(output.equity_curve, dtype=np.float64)
+        if not np.isfinite(equity).all():
+            for ts, val in zip(output.timestamps, output.equity_curve):
+                if math.isnan(val) or math.isinf(val):
+                    errors.add(f"Invalid equity curve value at {ts}: {val}")
+
+        # Series columns must line up with the timestamps
+        n = len(output.timestamps)
+        if len(output.equity_curve) != n:
+            errors.add(f"Equity curve has {len(output.equity_curve)} values for {n} timestamps")
+        if output.equity_curve and (
+            set(output.ohlc) != {"open", "high", "low", "close"}
+            or any(len(col) != n for col in output.ohlc.values())
+        ):
+            errors.add("Portfolio OHLC columns do not match timestamps")
+
+        # Order check: price/shares columns scanned in one pass; only walk them to report
+        orders = output.orders
+        if len({len(col) for col in (orders.id, orders.timestamp, orders.ticker, orders.type, orders.price, orders.shares)}) > 1:
+            errors.add("Order columns have mismatched lengths")
+        prices = np.asarray(orders.price, dtype=np.float64)
+        shares = np.asarray(orders.shares, dtype=np.float64)
+        if not ((prices > 0).all() and (shares > 0).all()):
+            for price in orders.price:
+                if price <= 0:
+                    errors.add(f"Order with non-positive price: {price}")
+            for share_count in orders.shares:
+                if share_count <= 0:
+                    errors.add(f"Order with non-positive shares: {share_count}")
 
         # Must have at least some equity curve data
         if not output.equity_curve:
@@ -4,7 +4,7 @@ import ast
 # WHITELISTS
 # ─────────────────────────────────────────────────────────────────────────────
 
-ALLOWED_MODULES: set[str] = {
+ALLOWED_MODULES: frozenset[str] = frozenset({
     # Math & data
     "numpy",
     "pandas",
@@ -12,7 +12,7 @@ ALLOWED_MODULES: set[str] = {
     "statistics",
     # ML, data engineering
     "scikit-learn",
-    "xgboost"
+    "xgboost",
     "sklearn",
     # Optimization
     "cvxpy",
@@ -36,9 +36,9 @@ ALLOWED_MODULES: set[str] = {
     "decimal",
     "fractions",
     "abc",
-}
+})
 
-ALLOWED_BUILTINS: set[str] = {
+ALLOWED_BUILTINS: frozenset[str] = frozenset({
     # Types & constructors
     "int", "float", "str", "bool", "list", "dict", "set", "tuple", "frozenset",
     "bytes", "bytearray", "complex",
@@ -56,9 +56,9 @@ ALLOWED_BUILTINS: set[str] = {
     # Misc safe
     "print", "slice", "object", "super", "property", "staticmethod", "classmethod",
     "divmod", "ord", "chr", "bin", "hex", "oct",
-}
+})
 
-ALLOWED_NODES: set[type] = {
+_allowed_nodes: set[type] = {
     # Module structure
     ast.Module, ast.Interactive, ast.Expression,
     # Statements
@@ -101,13 +101,15 @@ ALLOWED_NODES: set[type] = {
 
 # Python 3.12+ nodes
 if hasattr(ast, "TypeAlias"):
-    ALLOWED_NODES.add(ast.TypeAlias)
+    _allowed_nodes.add(ast.TypeAlias)
+
+ALLOWED_NODES: frozenset[type] = frozenset(_allowed_nodes)
 
 # ─────────────────────────────────────────────────────────────────────────────
 # BLOCKLISTS
 # ─────────────────────────────────────────────────────────────────────────────
 
-FORBIDDEN_ATTRIBUTES: set[str] = {
+FORBIDDEN_ATTRIBUTES: frozenset[str] = frozenset({
     # Introspection / code execution
     "__globals__", "__locals__", "__code__", "__builtins__",
     "__dict__", "__class__", "__bases__", "__mro__", "__subclasses__",
@@ -119,9 +121,9 @@ FORBIDDEN_ATTRIBUTES: set[str] = {
     "__loader__", "__spec__", "__path__", "__file__", "__cached__",
     # Dangerous descriptor methods
     "__reduce__", "__reduce_ex__", "__getstate__", "__setstate__",
-}
+})
 
-FORBIDDEN_BUILTINS: set[str] = {
+FORBIDDEN_BUILTINS: frozenset[str] = frozenset({
     # Code execution
     "eval", "exec", "compile", "__import__",
     # I/O
@@ -132,4 +134,4 @@ FORBIDDEN_BUILTINS: set[str] = {
     "globals", "locals", "vars", "dir",
     # Memory/object internals
     "memoryview",
-}
+})
@@ -11,14 +11,25 @@ class ExecutionPayload(BaseModel):
     end_date: datetime
     bar_size: BarSize = Field(default=None, description="Strategy BarSize")
     initial_capital: float = Field(default=100000.0, description="Starting cash of Python strategy", gt=0)
-    market_data: Dict[str, Any] = Field(..., description="Pre-fetched OHLC data")
+    market_data_arrow: str = Field(..., description="Pre-fetched OHLC data as a base64 Arrow IPC stream")
     config_params: Optional[Dict[str, Any]] = Field(default=None, description="Config parameters to inject as 'config' module in sandbox")
 
 
+class OrderColumns(BaseModel):
+    """Executed orders as parallel columns, one entry per fill (fields mirror response.Trade)."""
+    id: List[str] = Field(default_factory=list)
+    timestamp: List[str] = Field(default_factory=list, description="ISO fill timestamps")
+    ticker: List[str] = Field(default_factory=list)
+    type: List[str] = Field(default_factory=list, description="OrderType values")
+    price: List[float] = Field(default_factory=list)
+    shares: List[float] = Field(default_factory=list)
+
+
 class RawExecutionResult(BaseModel):
-    orders: List[Dict[str, Any]] = Field(default_factory=list, description="Raw trade data")
-    equity_curve: Dict[str, float] = Field(default_factory=dict, description="Timestamp -> equity mapping")
-    ohlc: Dict[str, Dict[str, float]] = Field(default_factory=dict, description="Timestamp -> portfolio OHLC")
+    orders: OrderColumns = Field(default_factory=OrderColumns, description="Raw trade data")
+    timestamps: List[str] = Field(default_factory=list, description="ISO bar timestamps; equity_curve and ohlc columns align with these")
+    equity_curve: List[float] = Field(default_factory=list, description="Equity per bar")
+    ohlc: Dict[str, List[float]] = Field(default_factory=dict, description="Portfolio OHLC columns (open/high/low/close) per bar")
     holding_weights: Dict[str, Dict[str, float]] = Field(default_factory=dict, description="Timestamp -> holding weights")
     final_value: float = Field(..., description="Final portfolio value")
     final_cash: float = Field(..., description="Final cash balance")
@@ -28,3 +39,8 @@ class RawExecutionResult(BaseModel):
     errors: BacktestRequestError = Field(default_factory=BacktestRequestError, description="Any errors encountered during execution")
     bar_size: BarSize = Field(default=None, description="Strategy BarSize")
     strategy_logs: List[str] = Field(default_factory=list, description="Messages emitted via self.log() during strategy execution")
+
+    @classmethod
+    def failed(cls, errors: BacktestRequestError, bar_size: Optional[BarSize]) -> "RawExecutionResult":
+        """Empty result carrying errors, for runs that produced no portfolio."""
+        return cls(final_value=0.0, final_cash=0.0, execution_time=0.0, errors=errors, bar_size=bar_size)
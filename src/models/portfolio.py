@@ -1,8 +1,51 @@
-from typing import Dict, List
+from dataclasses import dataclass
+from typing import Any, Dict, List
 from datetime import datetime
-from .response import OrderType, Trade
+from .response import OrderType
 from hqg_algorithms import Slice
 
+
+@dataclass(slots=True)
+class Fill:
+    """
+    Trade record produced inside the backtest loop.
+
+    Mirrors the fields of response.Trade but skips pydantic validation and the
+    per-instance __dict__, since thousands are created per backtest. Converted to
+    parallel columns for the wire (Fill.to_columns) and re-validated as Trade on the host.
+    """
+    id: str
+    timestamp: datetime
+    ticker: str
+    type: OrderType
+    price: float
+    shares: float
+
+    @staticmethod
+    def to_columns(fills: List["Fill"]) -> Dict[str, List[Any]]:
+        """
+        Serialize fills to wire-ready parallel columns in one pass.
+
+        A rebalance emits one fill per symbol at the same timestamp, so each
+        distinct timestamp is ISO-formatted once and shared across its fills.
+        """
+        iso: Dict[datetime, str] = {}
+        timestamps = []
+        for f in fills:
+            ts = iso.get(f.timestamp)
+            if ts is None:
+                ts = iso[f.timestamp] = f.timestamp.isoformat()
+            timestamps.append(ts)
+        return {
+            "id": [f.id for f in fills],
+            "timestamp": timestamps,
+            "ticker": [f.ticker for f in fills],
+            "type": [f.type.value for f in fills],
+            "price": [f.price for f in fills],
+            "shares": [f.shares for f in fills],
+        }
+
+
 class Portfolio:
     """ Manages portfolio state: cash, positions, rebalancing. """
     
@@ -20,16 +63,15 @@ class Portfolio:
 
     def get_weights(self, prices: Dict[str, float], tv: float) -> Dict[str, float]:
         """ returns dict of ticker: weight. Sum will be <= 1, as we will not return Cash """
-        wts = {}
-        for tick, quantity in self.positions.items():
-            if tick not in prices:
-                continue
-            wt = prices[tick] * quantity / tv
-            wts[tick] = wt
-        return wts
+        # prices omits symbols without a bar on this slice, so those are skipped rather than zeroed
+        return {
+            tick: prices[tick] * quantity / tv
+            for tick, quantity in self.positions.items()
+            if tick in prices
+        }
 
     
-    def rebalance(self, target_weights: Dict[str, float], prices: Dict[str, float], timestamp: datetime) -> List[Trade]:
+    def rebalance(self, target_weights: Dict[str, float], prices: Dict[str, float], timestamp: datetime) -> List[Fill]:
         """
         Rebalance portfolio to target weights.
         
@@ -39,7 +81,7 @@ class Portfolio:
             timestamp: Execution timestamp
             
         Returns:
-            List of trades executed
+            List of fills executed
         """
         trades = []
         
@@ -85,7 +127,7 @@ class Portfolio:
                 self.positions[symbol] += shares_to_trade
                 self.cash -= trade_value
                 
-                trades.append(Trade(
+                trades.append(Fill(
                     id=trade_id,
                     timestamp=timestamp,
                     ticker=symbol,
@@ -101,7 +143,7 @@ class Portfolio:
                 self.positions[symbol] -= shares_to_sell
                 self.cash += trade_value
                     
-                trades.append(Trade(
+                trades.append(Fill(
                     id=trade_id,
                     timestamp=timestamp,
                     ticker=symbol,
@@ -18,6 +18,7 @@ class PortfolioRecorder:
         self._n_symbols = len(symbols)
         self._symbol_idx: Dict[str, int] = {s: i for i, s in enumerate(symbols)}
         self._idx = 0  # write cursor
+        self._iso_keys: List[str] = []  # formatted timestamps, filled lazily by _iso_timestamps()
 
         # pre-allocate arrays
         self._timestamps = np.empty(n_bars, dtype=object)
@@ -41,81 +42,81 @@ class PortfolioRecorder:
         self._timestamps[i] = timestamp
         self._equity[i] = total_value
 
-        # ohlc
+        # ohlc and per-symbol weights (decimal) in a single pass over held positions
         p_open = cash
         p_high = cash
         p_low = cash
         p_close = cash
 
+        record_weights = total_value > 0
+        symbol_idx = self._symbol_idx
+        weights_row = self._weights[i]
+
         for symbol, shares in positions.items():
             if shares <= 0:
                 continue
             bar = slice_obj.bar(symbol)
-            if bar is None:
-                continue
-            p_open += shares * bar.open
-            p_high += shares * bar.high
-            p_low += shares * bar.low
-            p_close += shares * bar.close
-
-        self._ohlc[i, 0] = p_open
-        self._ohlc[i, 1] = p_high
-        self._ohlc[i, 2] = p_low
-        self._ohlc[i, 3] = p_close
-
-        # per-symbol weights (decimal)
-        if total_value > 0:
-            for symbol, shares in positions.items():
-                if shares <= 0:
-                    continue
-                if symbol not in prices or symbol not in self._symbol_idx:
-                    continue
-                j = self._symbol_idx[symbol]
-                self._weights[i, j] = (prices[symbol] * shares) / total_value
+            if bar is not None:
+                p_open += shares * bar.open
+                p_high += shares * bar.high
+                p_low += shares * bar.low
+                p_close += shares * bar.close
+            if record_weights:
+                price = prices.get(symbol)
+                j = symbol_idx.get(symbol)
+                if price is not None and j is not None:
+                    weights_row[j] = (price * shares) / total_value
+
+        self._ohlc[i] = (p_open, p_high, p_low, p_close)
 
         self._idx += 1
 
 
-    def to_ohlc(self) -> Dict[datetime, Dict[str, float]]:
+    def _iso_timestamps(self) -> List[str]:
+        """ISO-8601 strings for every recorded bar, formatted once and shared by the to_* exports."""
+        if len(self._iso_keys) != self._idx:
+            self._iso_keys = [ts.isoformat() for ts in self._timestamps[:self._idx]]
+        return self._iso_keys
+
+    def to_timestamps(self) -> List[str]:
         """
-        Returns portfolio OHLC as:
-        { datetime: {"open": ..., "high": ..., "low": ..., "close": ...} }
+        Returns ISO timestamps of every recorded bar; to_equity_curve()
+        and to_ohlc() columns are aligned with these.
         """
-        n = self._idx
-        result = {}
-        for i in range(n):
-            result[self._timestamps[i]] = {
-                "open": float(self._ohlc[i, 0]),
-                "high": float(self._ohlc[i, 1]),
-                "low": float(self._ohlc[i, 2]),
-                "close": float(self._ohlc[i, 3]),
-            }
-        return result
-
-    def to_equity_curve(self) -> Dict[datetime, float]:
+        return list(self._iso_timestamps())
+
+    def to_ohlc(self) -> Dict[str, List[float]]:
         """
-        Returns equity curve as {timestamp: total_value}.
+        Returns portfolio OHLC as columns:
+        {"open": [...], "high": [...], "low": [...], "close": [...]}
         """
         n = self._idx
+        ohlc = self._ohlc[:n]
         return {
-            self._timestamps[i]: float(self._equity[i])
-            for i in range(n)
+            "open": ohlc[:, 0].tolist(),
+            "high": ohlc[:, 1].tolist(),
+            "low": ohlc[:, 2].tolist(),
+            "close": ohlc[:, 3].tolist(),
         }
 
-    def to_holding_weights(self) -> Dict[datetime, List[Dict]]:
+    def to_equity_curve(self) -> List[float]:
+        """
+        Returns equity curve as [total_value, ...], one per timestamp.
+        """
+        return self._equity[:self._idx].tolist()
+
+    def to_holding_weights(self) -> Dict[str, Dict[str, float]]:
         """
         Returns holding weights as:
         {
-            str(timestamp): { symbol: weight, ... },
+            iso_timestamp: { symbol: weight, ... },
             ...
         }
         """
         n = self._idx
-        result = {}
-        for i in range(n):
-            weights_at_t = {}
-            for j, symbol in enumerate(self._symbols):
-                w = self._weights[i, j]
-                weights_at_t[symbol] = float(w)     # include weights of 0 if not held
-            result[self._timestamps[i]] = weights_at_t
-        return result
\ No newline at end of file
+        symbols = self._symbols
+        # include weights of 0 if not held
+        return {
+            ts: dict(zip(symbols, row))
+            for ts, row in zip(self._iso_timestamps(), self._weights[:n].tolist())
+        }
@@ -71,7 +71,16 @@ class BacktestRequest(BaseModel):
     @classmethod
     def validate_code(cls, v):
         max_bytes = 1_000_000  # 1 MB
-        num_bytes = len(v.encode('utf-8'))  # python has dynamic char sizing
+        # a UTF-8 char is 1-4 bytes, so len(v) bounds the size without encoding
+        if len(v) > max_bytes:
+            raise ValueError("Strategy code too large")
+        if v.isascii():  # O(1) flag check; ASCII is always 1 byte per char
+            return v
+        try:
+            num_bytes = len(v.encode('utf-8'))  # python has dynamic char sizing
+        except UnicodeEncodeError:
+            # lone surrogates survive decoding but break ast.parse and orjson later
+            raise ValueError("Strategy code must be valid UTF-8")
         if num_bytes > max_bytes:
             raise ValueError("Strategy code too large")
         return v
@@ -1,7 +1,6 @@
 from typing import List, Dict, Optional
 from hqg_algorithms import Strategy, Slice, PortfolioView, TargetWeights, Hold, Liquidate, ExecutionTiming
-from ..models.portfolio import Portfolio
-from ..models.response import Trade
+from ..models.portfolio import Portfolio, Fill
 from ..models.recorder import PortfolioRecorder
 from ..services.data_provider.base_provider import BaseDataProvider
 
@@ -24,7 +23,7 @@ class Backtester:
         timestamps: list,
         portfolio: Portfolio,
         recorder: PortfolioRecorder,
-    ) -> List[Trade]:
+    ) -> List[Fill]:
         """
         Core backtest loop.
         
@@ -36,14 +35,21 @@ class Backtester:
             recorder: PortfolioRecorder for time-series accumulation
         
         Returns:
-            List of Trades (recorder holds ohlc, equity, weights)
+            List of Fills (recorder holds ohlc, equity, weights)
         """
         universe = strategy.universe
         execution = strategy.cadence.execution
+        if execution not in (ExecutionTiming.CLOSE_TO_CLOSE, ExecutionTiming.CLOSE_TO_NEXT_OPEN):
+            raise ValueError(f"Unsupported ExecutionTiming: {execution}")
+        next_open = execution == ExecutionTiming.CLOSE_TO_NEXT_OPEN
+
+        # resolve slices once; the exec bar for CLOSE_TO_NEXT_OPEN is just the next entry
+        ordered_slices = [slices[ts] for ts in timestamps]
+        n_bars = len(timestamps)
         trades = []
 
         for i, timestamp in enumerate(timestamps):
-            slice_obj = slices[timestamp]
+            slice_obj = ordered_slices[i]
             prices = self._get_close(slice_obj, universe)
             tv = portfolio.get_total_value(prices)
 
@@ -76,19 +82,15 @@ class Backtester:
                 raise TypeError(f"on_data returned unknown signal type: {type(signal).__name__}")
 
             # determine execution prices via ExecutionTiming
-            if execution == ExecutionTiming.CLOSE_TO_CLOSE:
-                exec_prices = prices
-                exec_timestamp = timestamp
-
-            elif execution == ExecutionTiming.CLOSE_TO_NEXT_OPEN:
-                if i + 1 >= len(timestamps):
+            if next_open:
+                if i + 1 >= n_bars:
                     break
-                next_slice = slices[timestamps[i + 1]]
-                exec_prices = self._get_open(next_slice, universe)
+                exec_prices = self._get_open(ordered_slices[i + 1], universe)
                 exec_timestamp = timestamps[i + 1]
-
             else:
-                raise ValueError(f"Unsupported ExecutionTiming: {execution}")
+                # CLOSE_TO_CLOSE fills on the signal bar: reuse its close prices
+                exec_prices = prices
+                exec_timestamp = timestamp
 
             new_trades = portfolio.rebalance(target_weights, exec_prices, exec_timestamp)
             trades.extend(new_trades)
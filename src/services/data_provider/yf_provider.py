@@ -88,13 +88,18 @@ class YFDataProvider(BaseDataProvider):
     # NOTE: Tickers with limited history (e.g., IPO'd in 2015) will have cache_min far
     # after _DEFAULT_HISTORY_START. Without this check, cache_min > fetch_start would
     # cause _cache_covers to return False on every call, triggering endless re-fetches.
-    def _cache_covers(self, symbol: str, fetch_start: datetime, fetch_end: datetime) -> bool:
+    def _cache_covers(
+        self,
+        symbol: str,
+        fetch_start: datetime,
+        fetch_end: datetime,
+        cached: pd.DataFrame | None,
+    ) -> bool:
         """
-        Check if cache is full enough to skip a fetch.
+        Check if the cached frame for symbol is full enough to skip a fetch.
         End date: cache must extend to fetch_end.
         Start date: cache must start within 30 days of fetch_start (generous buffer because cache_min alr <= year 2000)
         """
-        cached = self._read_cache(symbol)
         if cached is None:
             return False
         
@@ -232,8 +237,11 @@ class YFDataProvider(BaseDataProvider):
         fetch_start = min(start_date, _DEFAULT_HISTORY_START)
         fetch_end = self._last_trading_day()
 
-        # lockless pre-scan
-        probable_misses = [s for s in symbols if not self._cache_covers(s, fetch_start, fetch_end)]
+        # lockless pre-scan; keep the frames so cache hits read each parquet once
+        cached = {s: self._read_cache(s) for s in symbols}
+        probable_misses = [
+            s for s in symbols if not self._cache_covers(s, fetch_start, fetch_end, cached[s])
+        ]
 
         # lock + double-check + fetch
         if probable_misses:
@@ -243,7 +251,12 @@ class YFDataProvider(BaseDataProvider):
             for s in sorted_misses:
                 locks[s].acquire()
             try:
-                confirmed_misses = [s for s in sorted_misses if not self._cache_covers(s, fetch_start, fetch_end)]
+                # another request may have filled these while we waited
+                for s in sorted_misses:
+                    cached[s] = self._read_cache(s)
+                confirmed_misses = [
+                    s for s in sorted_misses if not self._cache_covers(s, fetch_start, fetch_end, cached[s])
+                ]
 
                 if confirmed_misses:
                     new_data = self._fetch_from_yf(confirmed_misses, fetch_start, fetch_end)
@@ -252,7 +265,7 @@ class YFDataProvider(BaseDataProvider):
                         if symbol not in new_data:
                             raise ValueError(f"No data returned for {symbol}")
 
-                        existing = self._read_cache(symbol)
+                        existing = cached[symbol]
                         if existing is not None:
                             merged = pd.concat([existing, new_data[symbol]])
                             merged = merged[~merged.index.duplicated(keep="last")]
@@ -260,6 +273,7 @@ class YFDataProvider(BaseDataProvider):
                         else:
                             merged = new_data[symbol]
                         self._write_cache(symbol, merged)
+                        cached[symbol] = merged
             finally:
                 for s in reversed(sorted_misses):
                     locks[s].release()
@@ -268,7 +282,7 @@ class YFDataProvider(BaseDataProvider):
         frames: dict[tuple[str, str], pd.Series] = {}
 
         for symbol in symbols:
-            sym_df = self._read_cache(symbol)
+            sym_df = cached[symbol]
             if sym_df is None:
                 raise ValueError(f"Cache miss after fetch for {symbol}")
 
@@ -19,12 +19,17 @@ def build_backtest_response(
     data_provider: BaseDataProvider,
 ) -> BacktestResponse:
     
-    trades = [Trade(**t) for t in raw_result.orders]
+    orders = raw_result.orders
+    trades = [
+        Trade(id=i, timestamp=ts, ticker=tk, type=ty, price=p, shares=s)
+        for i, ts, tk, ty, p, s in zip(
+            orders.id, orders.timestamp, orders.ticker, orders.type, orders.price, orders.shares
+        )
+    ]
 
-    equity_curve_dt = {
-        datetime.fromisoformat(ts): val
-        for ts, val in raw_result.equity_curve.items()
-    }
+    # equity curve and ohlc columns share one parsed timestamp axis
+    timestamps = [datetime.fromisoformat(ts) for ts in raw_result.timestamps]
+    equity_curve_dt = dict(zip(timestamps, raw_result.equity_curve))
 
     metrics = calculate_metrics(
         equity_curve_data=equity_curve_dt,
@@ -34,13 +39,17 @@ def build_backtest_response(
         bar_size=raw_result.bar_size,
     )
 
-    # NOTE: ohlc/weights Response composition duplicate timestamp iteration
+    # NOTE: weights Response composition still re-parses timestamps
+    ohlc = raw_result.ohlc
     candles = [
         EquityCandle(
-            time=int(datetime.fromisoformat(ts).timestamp()),
-            **ohlc_vals,
+            time=int(ts.timestamp()),
+            open=o,
+            high=h,
+            low=l,
+            close=c,
         )
-        for ts, ohlc_vals in raw_result.ohlc.items()
+        for ts, o, h, l, c in zip(timestamps, ohlc["open"], ohlc["high"], ohlc["low"], ohlc["close"])
     ]
 
     holding_weights = [
@@ -187,15 +187,11 @@ def _calculate_max_drawdown_and_duration(equity_curve: pd.Series) -> Tuple[float
     running_max = equity_curve.expanding().max()
     drawdown = (equity_curve - running_max) / running_max
 
-    max_duration = 0
-    current_duration = 0
-
-    for dd in drawdown:
-        if dd < 0:
-            current_duration += 1
-            max_duration = max(max_duration, current_duration)
-        else:
-            current_duration = 0
+    # longest run of consecutive underwater bars: pad with 0s so every run
+    # has a rising and a falling edge, then take the widest start/end pair
+    underwater = np.concatenate(([0], (drawdown.to_numpy() < 0).view(np.int8), [0]))
+    edges = np.flatnonzero(np.diff(underwater))
+    max_duration = int((edges[1::2] - edges[::2]).max()) if edges.size else 0
 
     return float(abs(drawdown.min())), max_duration
 
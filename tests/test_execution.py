@@ -1,26 +1,50 @@
+import ast
 import asyncio
 import cProfile
 import pstats
 import io
 import random
+import sys
 import time
+import timeit
 import pytest
 import httpx
+import numpy as np
+import orjson
+import pandas as pd
+from pydantic import ValidationError
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from src.models.request import BacktestRequest
+from hqg_algorithms import BarSize
+from src.models.request import BacktestRequest, ExecutionException
 from src.execution.analysis import StaticAnalyzer
+from src.execution.executor import PooledExecutor
+from src.execution.orchestrator import dataframe_to_arrow
+from src.execution.container.entrypoint import arrow_to_slices
+from src.execution.output_validator import OutputValidator
+from src.models.execution import ExecutionPayload, OrderColumns, RawExecutionResult
+from src.models.portfolio import Fill
+from src.models.response import OrderType
+from src.services.data_provider.mock_provider import MockDataProvider
+from src.utils.build_response import build_backtest_response
 from src.api.handlers import BacktestHandler
 from src.api.server import app
 from tests.test_strategies.pytest_strategies import TestStrategies
 
 _STRATS_DIR = Path(__file__).parent / "test_strategies" / "strats"
 _STRAT_FILES = sorted(_STRATS_DIR.glob("*.py"))
+# read once at import so load/stress payload construction never touches disk
+_STRAT_SOURCES = {p.stem: p.read_text(encoding="utf-8") for p in _STRAT_FILES}
+_STRAT_CODES = tuple(_STRAT_SOURCES.values())
 
 
-def _random_strategy() -> str:
-    """Return the source code of a randomly selected strategy from strats/."""
-    return random.choice(_STRAT_FILES).read_text()
+def _random_strategies(n: int, seed: int = 0) -> list[str]:
+    """
+    Return the source code of n strategies drawn from strats/. Seeded, so
+    repeated load/stress runs send the same mix and stay comparable.
+    """
+    return random.Random(seed).choices(_STRAT_CODES, k=n)
 
 
 def make_request(
@@ -48,6 +72,43 @@ def make_request(
     )
 
 
+def _market_frame(symbols: list[str], n: int = 5) -> pd.DataFrame:
+    """Small MultiIndex (symbol, field) OHLCV frame, shaped like YFDataProvider output."""
+    index = pd.bdate_range("2024-01-01", periods=n)
+    columns = pd.MultiIndex.from_product([symbols, ["open", "high", "low", "close", "volume"]])
+    values = np.arange(n * len(columns), dtype=np.float64).reshape(n, len(columns)) + 100.0
+    return pd.DataFrame(values, index=index, columns=columns)
+
+
+def _raw_result(**overrides) -> RawExecutionResult:
+    """Valid three-bar, one-order RawExecutionResult in the sandbox's column layout."""
+    fields = dict(
+        orders=OrderColumns(
+            id=["order_1"],
+            timestamp=["2024-01-02T00:00:00"],
+            ticker=["AAPL"],
+            type=["Buy"],
+            price=[100.0],
+            shares=[10.0],
+        ),
+        timestamps=["2024-01-02T00:00:00", "2024-01-03T00:00:00", "2024-01-04T00:00:00"],
+        equity_curve=[10000.0, 10050.0, 9990.0],
+        ohlc={
+            "open": [10000.0, 10010.0, 10040.0],
+            "high": [10020.0, 10060.0, 10045.0],
+            "low": [9995.0, 10005.0, 9980.0],
+            "close": [10000.0, 10050.0, 9990.0],
+        },
+        holding_weights={"2024-01-02T00:00:00": {"AAPL": 0.1}},
+        final_value=9990.0,
+        final_cash=9000.0,
+        final_positions={"AAPL": 10.0},
+        bar_size=BarSize.DAILY,
+    )
+    fields.update(overrides)
+    return RawExecutionResult(**fields)
+
+
 class TestCorrectness:
     """
     Verify components enforce their expected constraints.
@@ -65,14 +126,127 @@ class TestCorrectness:
         assert any("Strategy" in e for e in request.errors.errors)
 
     @pytest.mark.unit
-    def test_static_analyzer_validates_allowed_nodes(self):
-        request = make_request(TestStrategies.VALID_BUYHOLD)
+    @pytest.mark.parametrize(
+        "code",
+        [
+            TestStrategies.VALID_MINIMAL,
+            TestStrategies.VALID_BUYHOLD,
+            TestStrategies.VALID_SMA,
+            TestStrategies.VALID_MULTIASSET,
+            TestStrategies.VALID_NUMPY_PANDAS,
+            TestStrategies.VALID_MATH,
+            TestStrategies.VALID_COMPREHENSIONS,
+        ],
+        ids=[
+            "minimal",
+            "buyhold",
+            "sma",
+            "multiasset",
+            "numpy_pandas",
+            "math",
+            "comprehensions",
+        ],
+    )
+    def test_static_analyzer_validates_allowed_nodes(self, code):
+        request = make_request(code)
         result = StaticAnalyzer.analyze(request)
 
         assert (
             result.errors.is_empty()
         ), f"Valid strategy failed: {result.errors.errors}"
 
+    @pytest.mark.unit
+    def test_arrow_market_data_round_trips_to_slices(self):
+        symbols = ["AAPL", "BRK.B"]  # dotted tickers must survive the "{symbol}.{field}" column names
+        data = _market_frame(symbols)
+        data.loc[data.index[2], ("AAPL", "close")] = np.nan
+        data = data.drop(columns=[("BRK.B", "volume")])
+
+        slices, timestamps = arrow_to_slices(dataframe_to_arrow(data, symbols))
+
+        assert timestamps == data.index.tolist()
+        assert list(slices) == timestamps
+        for ts in timestamps:
+            for symbol in symbols:
+                bar = slices[ts][symbol]
+                for field in ("open", "high", "low", "close"):
+                    assert getattr(bar, field) == pytest.approx(data.loc[ts, (symbol, field)], nan_ok=True)
+            assert slices[ts]["AAPL"].volume == data.loc[ts, ("AAPL", "volume")]
+            assert slices[ts]["BRK.B"].volume is None
+
+    @pytest.mark.unit
+    def test_fill_to_columns(self):
+        t1, t2 = datetime(2024, 1, 2), datetime(2024, 1, 3)
+        fills = [
+            Fill(id="1", timestamp=t1, ticker="AAPL", type=OrderType.BUY, price=100.0, shares=5.0),
+            Fill(id="2", timestamp=t1, ticker="MSFT", type=OrderType.BUY, price=300.0, shares=2.0),
+            Fill(id="3", timestamp=t2, ticker="AAPL", type=OrderType.SELL, price=101.0, shares=5.0),
+        ]
+
+        columns = Fill.to_columns(fills)
+
+        assert columns == {
+            "id": ["1", "2", "3"],
+            "timestamp": [t1.isoformat(), t1.isoformat(), t2.isoformat()],
+            "ticker": ["AAPL", "MSFT", "AAPL"],
+            "type": ["Buy", "Buy", "Sell"],
+            "price": [100.0, 300.0, 101.0],
+            "shares": [5.0, 2.0, 5.0],
+        }
+        assert OrderColumns(**columns).ticker == ["AAPL", "MSFT", "AAPL"]
+        assert Fill.to_columns([]) == {k: [] for k in columns}
+
+    @pytest.mark.unit
+    def test_output_validator_accepts_aligned_columns(self):
+        raw = _raw_result()
+        assert OutputValidator().validate(raw) is raw
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "overrides, message",
+        [
+            ({"equity_curve": [10000.0, 10050.0]}, "Equity curve has 2 values for 3 timestamps"),
+            ({"ohlc": {"open": [1.0] * 3, "high": [1.0] * 3, "low": [1.0] * 3}}, "Portfolio OHLC columns do not match timestamps"),
+            ({"ohlc": {k: [1.0, 1.0] for k in ("open", "high", "low", "close")}}, "Portfolio OHLC columns do not match timestamps"),
+            (
+                {"orders": OrderColumns(id=["1", "2"], timestamp=["2024-01-02T00:00:00"], ticker=["AAPL"], type=["Buy"], price=[1.0], shares=[1.0])},
+                "Order columns have mismatched lengths",
+            ),
+        ],
+        ids=["equity_length", "ohlc_missing_column", "ohlc_length", "order_lengths"],
+    )
+    def test_output_validator_rejects_misaligned_columns(self, overrides, message):
+        with pytest.raises(ExecutionException) as exc_info:
+            OutputValidator().validate(_raw_result(**overrides))
+
+        assert message in exc_info.value.errors.errors
+
+    @pytest.mark.unit
+    def test_build_response_from_columns(self):
+        raw = _raw_result()
+        request = make_request(
+            TestStrategies.VALID_MINIMAL,
+            start_date=datetime(2024, 1, 2),
+            end_date=datetime(2024, 1, 4),
+            initial_capital=10000.0,
+        )
+
+        response = build_backtest_response("job", request, raw, MockDataProvider())
+
+        assert [c.time for c in response.candles] == [
+            int(datetime.fromisoformat(ts).timestamp()) for ts in raw.timestamps
+        ]
+        assert [(c.open, c.high, c.low, c.close) for c in response.candles] == list(
+            zip(raw.ohlc["open"], raw.ohlc["high"], raw.ohlc["low"], raw.ohlc["close"])
+        )
+        assert len(response.orders) == 1
+        trade = response.orders[0]
+        assert (trade.id, trade.ticker, trade.type, trade.price, trade.shares) == ("order_1", "AAPL", OrderType.BUY, 100.0, 10.0)
+        assert trade.timestamp == datetime(2024, 1, 2)
+        assert [w.weights for w in response.holding_weights] == [{"AAPL": 0.1}]
+        assert response.metrics.total_orders == 1
+        assert response.parameters.starting_equity == 10000.0
+
     @pytest.mark.integration
     @pytest.mark.asyncio
     async def test_buyhold_strategy_executes(self):
@@ -257,7 +431,7 @@ class TestSecurity:
     def test_blocks_os_import_at_static_analyzer(self):
         """
         Import os module for system command execution.
-        Expected failure: StaticAnalyzer._validate_imports
+        Expected failure: StaticAnalyzer import check (_check_import)
         """
         request = make_request(TestStrategies.MALICIOUS_OS_IMPORT)
         StaticAnalyzer.analyze(request)
@@ -268,7 +442,7 @@ class TestSecurity:
     def test_blocks_subprocess_import_at_static_analyzer(self):
         """
         Import subprocess for arbitrary command execution.
-        Expected failure: StaticAnalyzer._validate_imports
+        Expected failure: StaticAnalyzer import check (_check_import)
         """
         request = make_request(TestStrategies.MALICIOUS_SUBPROCESS_IMPORT)
         StaticAnalyzer.analyze(request)
@@ -279,7 +453,7 @@ class TestSecurity:
     def test_blocks_eval_at_static_analyzer(self):
         """
         Use eval() to execute arbitrary code strings.
-        Expected failure: StaticAnalyzer._validate_builtins
+        Expected failure: StaticAnalyzer builtin call check (_check_call)
         """
         request = make_request(TestStrategies.MALICIOUS_EVAL)
         StaticAnalyzer.analyze(request)
@@ -290,7 +464,7 @@ class TestSecurity:
     def test_blocks_open_at_static_analyzer(self):
         """
         Use open() to read sensitive files.
-        Expected failure: StaticAnalyzer._validate_builtins
+        Expected failure: StaticAnalyzer builtin call check (_check_call)
         """
         request = make_request(TestStrategies.MALICIOUS_OPEN_FILE)
         StaticAnalyzer.analyze(request)
@@ -301,7 +475,7 @@ class TestSecurity:
     def test_blocks_globals_access_at_static_analyzer(self):
         """
         Access __globals__ to escape sandbox.
-        Expected failure: StaticAnalyzer._validate_attributes
+        Expected failure: StaticAnalyzer attribute check (_check_attribute)
         """
         request = make_request(TestStrategies.MALICIOUS_GLOBALS_ACCESS)
         StaticAnalyzer.analyze(request)
@@ -311,6 +485,153 @@ class TestSecurity:
             "__globals__" in e and "forbidden" in e for e in request.errors.errors
         )
 
+    def test_rejects_lone_surrogates_at_request_validation(self):
+        """
+        Code that is not encodable as UTF-8 (a lone surrogate).
+        Expected failure: BacktestRequest code validator, before the analyzer
+        """
+        with pytest.raises(ValidationError, match="valid UTF-8"):
+            make_request('x = "\ud800"\n' * 2)
+
+
+_ECHO_RESULT = orjson.dumps(RawExecutionResult(final_value=1.0, final_cash=1.0, bar_size=BarSize.DAILY).model_dump())
+
+
+def _echo_worker(prefix: bytes = b"") -> str:
+    """
+    Source for a stand-in sandbox worker: answers every payload line with one
+    fixed result line, after writing `prefix` to the same stream.
+    """
+    return (
+        "import sys\n"
+        "for line in sys.stdin.buffer:\n"
+        f"    sys.stdout.buffer.write({prefix!r} + {_ECHO_RESULT!r} + b'\\n')\n"
+        "    sys.stdout.buffer.flush()\n"
+    )
+
+
+class _LocalPool(PooledExecutor):
+    """PooledExecutor whose workers are local processes instead of containers."""
+
+    def __init__(self, worker_args: list[str], **kwargs):
+        super().__init__(**kwargs)
+        self.worker_args = worker_args
+
+    def _docker_cmd(self, module: str) -> list[str]:
+        return [sys.executable, *self.worker_args]
+
+
+def _payload(code: str = TestStrategies.VALID_MINIMAL, symbols: tuple[str, ...] = ("AAPL", "MSFT")) -> ExecutionPayload:
+    return ExecutionPayload(
+        strategy_code=code,
+        start_date=datetime(2024, 1, 1),
+        end_date=datetime(2024, 2, 1),
+        bar_size=BarSize.DAILY,
+        market_data_arrow=dataframe_to_arrow(_market_frame(list(symbols)), list(symbols)),
+    )
+
+
+_PATCHING_STRATEGY = """
+import numpy as np
+from hqg_algorithms import Strategy, Cadence, BarSize, Signal, TargetWeights
+
+np.mean = lambda *args, **kwargs: -1.0
+
+class Patcher(Strategy):
+    universe = ["AAPL"]
+    cadence = Cadence(bar_size=BarSize.DAILY)
+
+    def on_data(self, data, portfolio) -> Signal:
+        return TargetWeights({"AAPL": 1.0})
+"""
+
+_FD1_WRITING_STRATEGY = """
+from pandas.io.common import os
+from hqg_algorithms import Strategy, Cadence, BarSize, Signal, TargetWeights
+
+class Chatty(Strategy):
+    universe = ["AAPL"]
+    cadence = Cadence(bar_size=BarSize.DAILY)
+
+    def on_data(self, data, portfolio) -> Signal:
+        os.write(1, b"log\\n")
+        return TargetWeights({"AAPL": 1.0})
+"""
+
+_CHECKING_STRATEGY = """
+import numpy as np
+from hqg_algorithms import Strategy, Cadence, BarSize, Signal, TargetWeights
+
+class Checker(Strategy):
+    universe = ["AAPL"]
+    cadence = Cadence(bar_size=BarSize.DAILY)
+
+    def on_data(self, data, portfolio) -> Signal:
+        if np.mean([1.0, 3.0]) != 2.0:
+            raise RuntimeError("numpy.mean was patched by an earlier run")
+        return TargetWeights({"AAPL": 1.0})
+"""
+
+
+@pytest.mark.unit
+class TestPooledExecutor:
+    """
+    Pool bookkeeping, with local processes standing in for sandbox containers.
+    """
+
+    def test_waiters_get_a_worker_while_workers_are_recycled(self):
+        """
+        max_runs=1 retires the only worker after every backtest; requests queued
+        behind it must get a freshly spawned replacement instead of blocking forever.
+        """
+        pool = _LocalPool(["-c", _echo_worker()], size=1, max_runs=1, timeout=10)
+        try:
+            with ThreadPoolExecutor(max_workers=4) as threads:
+                futures = [threads.submit(pool.execute, _payload()) for _ in range(6)]
+                results = [f.result(timeout=30) for f in futures]
+        finally:
+            pool.close()
+
+        assert all(r.errors.is_empty() and r.final_value == 1.0 for r in results)
+        assert pool._spawned == 0
+
+    def test_worker_runs_do_not_share_interpreter_state(self):
+        """A strategy that monkeypatches numpy must not affect the next run on the same worker."""
+        pool = _LocalPool(["-m", "src.execution.container.worker"], size=1, max_runs=10, timeout=30)
+        try:
+            patched = pool.execute(_payload(_PATCHING_STRATEGY, ("AAPL",)))
+            checked = pool.execute(_payload(_CHECKING_STRATEGY, ("AAPL",)))
+        finally:
+            pool.close()
+
+        assert patched.errors.is_empty(), patched.errors.errors
+        assert checked.errors.is_empty(), checked.errors.errors
+        assert len(checked.equity_curve) == 5
+
+    def test_strategy_writes_to_fd1_do_not_reach_the_result_stream(self):
+        """Raw fd 1 output from one run must not become, or displace, the next run's result."""
+        pool = _LocalPool(["-m", "src.execution.container.worker"], size=1, max_runs=10, timeout=30)
+        try:
+            chatty = pool.execute(_payload(_FD1_WRITING_STRATEGY, ("AAPL",)))
+            following = pool.execute(_payload(TestStrategies.VALID_MINIMAL, ("AAPL", "MSFT")))
+        finally:
+            pool.close()
+
+        assert chatty.errors.is_empty(), chatty.errors.errors
+        assert set(chatty.final_positions) == {"AAPL"}
+        assert following.errors.is_empty(), following.errors.errors
+        assert set(following.final_positions) == {"AAPL", "MSFT"}
+
+    def test_worker_is_retired_when_its_output_does_not_parse(self):
+        """A stray line ahead of the result desyncs the stream; that worker must not be reused."""
+        pool = _LocalPool(["-c", _echo_worker(prefix=b"log\n")], size=1, max_runs=10, timeout=10)
+        try:
+            result = pool.execute(_payload())
+            assert not result.errors.is_empty()
+            assert pool._spawned == 0 and not pool._idle
+        finally:
+            pool.close()
+
 @pytest.mark.integration
 class TestIntegration:
     """
@@ -325,7 +646,7 @@ class TestIntegration:
     @pytest.mark.asyncio
     async def test_mean_variance_strategy(self):
         """Mean-variance optimization strategy (strategy_20)."""
-        strategy_code = (_STRATS_DIR / "strategy_20_mean_variance_opt_monthly.py").read_text()
+        strategy_code = _STRAT_SOURCES["strategy_20_mean_variance_opt_monthly"]
 
         handler = BacktestHandler()
         request = make_request(
@@ -343,7 +664,7 @@ class TestIntegration:
     @pytest.mark.asyncio
     async def test_sma_crossover_strategy(self):
         """SMA crossover strategy (strategy_02)."""
-        strategy_code = (_STRATS_DIR / "strategy_02_sma_crossover_qqq_weekly.py").read_text()
+        strategy_code = _STRAT_SOURCES["strategy_02_sma_crossover_qqq_weekly"]
 
         handler = BacktestHandler()
         request = make_request(
@@ -358,6 +679,68 @@ class TestIntegration:
         assert result.metrics is not None
         assert len(result.candles) > 0
 
+
+async def _run_concurrent_backtests(n: int, label: str) -> None:
+    """
+    Fire n concurrent /api/v1/backtest requests through the ASGI app and check
+    every response. Shared body of TestLoad and TestStress.
+    """
+    strategies = _random_strategies(n)
+    payloads = [
+        {
+            "strategy_code": strategies[i],
+            "name": f"{label} {i}",
+            "start_date": "2019-01-01T00:00:00",
+            "end_date": "2025-01-01T00:00:00",
+            "initial_capital": 100000.0,
+            "commission": 0.001,
+            "slippage": 0.001,
+        }
+        for i in range(n)
+    ]
+
+    async def timed_request(client, request_id, payload):
+        start = time.perf_counter()
+        response = await client.post(
+            "/api/v1/backtest", json=payload, timeout=600.0
+        )
+        elapsed = time.perf_counter() - start
+        return request_id, response, elapsed
+
+    _start = time.perf_counter()
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://testserver",
+    ) as client:
+        # first failure cancels the rest instead of waiting out their timeouts
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(timed_request(client, i, payloads[i])) for i in range(n)]
+    results = [task.result() for task in tasks]
+
+    _elapsed = time.perf_counter() - _start
+
+    for request_id, response, elapsed in results:
+        assert response.status_code == 200, (
+            f"Request {request_id} failed with {response.status_code}: {response.text}"
+        )
+
+    for request_id, response, elapsed in results:
+        data = orjson.loads(response.content)
+        assert "metrics" in data
+        assert "candles" in data
+        assert "orders" in data
+        metrics = data["metrics"]
+        assert 0.0 <= metrics["max_drawdown"] <= 1.0, (
+            f"Request {request_id}: max_drawdown out of range: {metrics['max_drawdown']}"
+        )
+        assert 0.0 <= metrics["win_rate"] <= 1.0, (
+            f"Request {request_id}: win_rate out of range: {metrics['win_rate']}"
+        )
+
+    print(f"{label}: {n} requests completed in {_elapsed:.2f}s")
+
+
 @pytest.mark.integration
 @pytest.mark.load
 class TestLoad:
@@ -370,57 +753,9 @@ class TestLoad:
 
     @pytest.mark.asyncio
     async def test_concurrent_backtest_requests(self):
-        payloads = [
-            {
-                "strategy_code": _random_strategy(),
-                "name": f"Load Test {i}",
-                "start_date": "2019-01-01T00:00:00",
-                "end_date": "2025-01-01T00:00:00",
-                "initial_capital": 100000.0,
-                "commission": 0.001,
-                "slippage": 0.001,
-            }
-            for i in range(self.N)
-        ]
+        await _run_concurrent_backtests(self.N, "Load Test")
+
 
-        async def timed_request(client, request_id, payload):
-            start = time.perf_counter()
-            response = await client.post(
-                "/api/v1/backtest", json=payload, timeout=600.0
-            )
-            elapsed = time.perf_counter() - start
-            return request_id, response, elapsed
-
-        _start = time.perf_counter()
-
-        async with httpx.AsyncClient(
-            transport=httpx.ASGITransport(app=app),
-            base_url="http://testserver",
-        ) as client:
-            tasks = [timed_request(client, i, payloads[i]) for i in range(self.N)]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        _elapsed = time.perf_counter() - _start
-
-        for request_id, response, elapsed in results:
-            assert response.status_code == 200, (
-                f"Request {request_id} failed with {response.status_code}: {response.text}"
-            )
-
-        for request_id, response, elapsed in results:
-            data = response.json()
-            assert "metrics" in data
-            assert "candles" in data
-            assert "orders" in data
-            metrics = data["metrics"]
-            assert 0.0 <= metrics["max_drawdown"] <= 1.0, (
-                f"Request {request_id}: max_drawdown out of range: {metrics['max_drawdown']}"
-            )
-            assert 0.0 <= metrics["win_rate"] <= 1.0, (
-                f"Request {request_id}: win_rate out of range: {metrics['win_rate']}"
-            )
-
-        print(f"Load Test: {self.N} requests completed in {_elapsed:.2f}s")
 @pytest.mark.integration
 @pytest.mark.stress
 class TestStress:
@@ -433,57 +768,17 @@ class TestStress:
 
     @pytest.mark.asyncio
     async def test_concurrent_backtest_requests(self):
-        payloads = [
-            {
-                "strategy_code": _random_strategy(),
-                "name": f"Stress Test {i}",
-                "start_date": "2019-01-01T00:00:00",
-                "end_date": "2025-01-01T00:00:00",
-                "initial_capital": 100000.0,
-                "commission": 0.001,
-                "slippage": 0.001,
-            }
-            for i in range(self.N)
-        ]
+        await _run_concurrent_backtests(self.N, "Stress Test")
 
-        async def timed_request(client, request_id, payload):
-            start = time.perf_counter()
-            response = await client.post(
-                "/api/v1/backtest", json=payload, timeout=600.0
-            )
-            elapsed = time.perf_counter() - start
-            return request_id, response, elapsed
-
-        _start = time.perf_counter()
-
-        async with httpx.AsyncClient(
-            transport=httpx.ASGITransport(app=app),
-            base_url="http://testserver",
-        ) as client:
-            tasks = [timed_request(client, i, payloads[i]) for i in range(self.N)]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        _elapsed = time.perf_counter() - _start
-
-        for request_id, response, elapsed in results:
-            assert response.status_code == 200, (
-                f"Request {request_id} failed with {response.status_code}: {response.text}"
-            )
-
-        for request_id, response, elapsed in results:
-            data = response.json()
-            assert "metrics" in data
-            assert "candles" in data
-            assert "orders" in data
-            metrics = data["metrics"]
-            assert 0.0 <= metrics["max_drawdown"] <= 1.0, (
-                f"Request {request_id}: max_drawdown out of range: {metrics['max_drawdown']}"
-            )
-            assert 0.0 <= metrics["win_rate"] <= 1.0, (
-                f"Request {request_id}: win_rate out of range: {metrics['win_rate']}"
-            )
-
-        print(f"Stress Test: {self.N} requests completed in {_elapsed:.2f}s")
+
+def _best_ms(stmt, repeat: int = 5) -> float:
+    """
+    Best-of-`repeat` ms per call, like `python -m timeit`: autorange() picks
+    the loop count, GC is off while timing, and the minimum filters out noise.
+    """
+    timer = timeit.Timer(stmt)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e3
 
 
 async def ProfileTests():
@@ -521,6 +816,17 @@ async def ProfileTests():
     print("Per-Test Timing Summary")
     print(f"{'='*70}\n")
 
+    # Static analysis: parse cost vs. visitor cost, per strategy
+    print(f"{'strategy':<45} {'parse+analyze':>14} {'analyze-only':>13}  (ms/iter)")
+    for name, code in _STRAT_SOURCES.items():
+        request = make_request(code)
+        tree = ast.parse(code)
+
+        full = _best_ms(lambda: StaticAnalyzer.analyze_tree(ast.parse(code), request))
+        visit = _best_ms(lambda: StaticAnalyzer.analyze_tree(tree, request))
+
+        print(f"{name:<45} {full:>14.3f} {visit:>13.3f}")
+
 
 if __name__ == "__main__":
     """
@@ -0,0 +1,25 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils.metrics import _calculate_max_drawdown_and_duration
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "equity, max_drawdown, duration",
+    [
+        ([100.0, 90.0, 80.0, 85.0], 0.2, 3),
+        ([100.0, 110.0, 100.0, 90.0, 95.0], 20.0 / 110.0, 3),
+        # a NaN bar is not underwater, so it splits the run around it
+        ([100.0, 90.0, np.nan, 80.0, 120.0, 110.0], 0.2, 1),
+        ([100.0, 100.0, 110.0, 120.0], 0.0, 0),
+        ([100.0], 0.0, 0),
+    ],
+    ids=["all_underwater", "ends_underwater", "nan_gap", "never_underwater", "single_bar"],
+)
+def test_max_drawdown_and_duration(equity, max_drawdown, duration):
+    dd, dd_duration = _calculate_max_drawdown_and_duration(pd.Series(equity))
+
+    assert dd == pytest.approx(max_drawdown)
+    assert dd_duration == duration